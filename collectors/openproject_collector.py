@@ -15,6 +15,12 @@ import base64
 from pathlib import Path
 import yaml
 
+# Prefer the libyaml C loader when available (~10x faster YAML parsing)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 class OpenProjectCollector:
     """Collects raw data from OpenProject API and stores in raw tables"""
 
@@ -59,7 +65,7 @@ class OpenProjectCollector:
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file"""
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
 
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
@@ -12,6 +12,12 @@ import logging.handlers
 import re
 import yaml
 
+# Prefer the libyaml C loader when available (~10x faster YAML parsing)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 class OpenProjectExtractor:
     """Extracts raw OpenProject API data into tool-layer tables"""
 
@@ -27,7 +33,7 @@ class OpenProjectExtractor:
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file"""
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
 
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
@@ -61,6 +67,44 @@ class OpenProjectExtractor:
         """Get database connection"""
         return mysql.connector.connect(**self.db_config)
 
+    def _fetch_latest_raw(self, connection, raw_table: str) -> Optional[str]:
+        """Fetch the newest raw payload for this connection
+
+        Uses a prepared (binary protocol) cursor so the server parses the
+        statement once and the large data column skips the text protocol;
+        the (connection_id, created_at) index makes this an index seek.
+        """
+        cursor = connection.cursor(prepared=True)
+        try:
+            cursor.execute(f"""
+                SELECT data FROM {raw_table}
+                WHERE connection_id = %s AND data IS NOT NULL
+                ORDER BY created_at DESC LIMIT 1
+            """, (self.connection_id,))
+
+            row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            cursor.close()
+
+    def _purge_stale_rows(self, cursor, tool_table: str, ids: List):
+        """Delete rows for this connection that are no longer present in the raw data
+
+        The upserts use ON DUPLICATE KEY UPDATE, so existing rows are refreshed
+        in place — only rows missing from the latest payload need deleting.
+        """
+        if ids:
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(
+                f"DELETE FROM {tool_table} WHERE connection_id = %s AND id NOT IN ({placeholders})",
+                (self.connection_id, *ids)
+            )
+        else:
+            cursor.execute(
+                f"DELETE FROM {tool_table} WHERE connection_id = %s",
+                (self.connection_id,)
+            )
+
     def _parse_duration(self, duration_str: Optional[str]) -> Optional[float]:
         """Parse ISO 8601 duration (PT8H30M) to hours"""
         if not duration_str:
@@ -150,12 +194,6 @@ class OpenProjectExtractor:
         cursor = connection.cursor(dictionary=True)
 
         try:
-            # Clear existing tool data for this connection
-            cursor.execute("""
-                DELETE FROM _tool_openproject_work_packages 
-                WHERE connection_id = %s
-            """, (self.connection_id,))
-
             # Get count of raw records first
             cursor.execute("""
                 SELECT COUNT(*) as total
@@ -216,6 +254,10 @@ class OpenProjectExtractor:
                 connection.commit()
                 offset += batch_size
 
+            # Remove work packages that disappeared upstream
+            self._purge_stale_rows(cursor, '_tool_openproject_work_packages', list(processed_wp_ids))
+            connection.commit()
+
             self.logger.info(f"Extracted {extracted_count} unique work packages")
             return extracted_count
 
@@ -419,25 +461,34 @@ class OpenProjectExtractor:
         cursor = connection.cursor(dictionary=True)
 
         try:
-            cursor.execute("""
-                SELECT data FROM _raw_openproject_api_projects 
-                WHERE connection_id = %s AND data IS NOT NULL
-                ORDER BY created_at DESC LIMIT 1
-            """, (self.connection_id,))
-
-            raw_record = cursor.fetchone()
-            if not raw_record:
+            raw_data = self._fetch_latest_raw(connection, '_raw_openproject_api_projects')
+            if not raw_data:
                 self.logger.warning("No raw project data found")
                 return 0
 
-            data = json.loads(raw_record['data'])
+            data = json.loads(raw_data)
             elements = data.get('_embedded', {}).get('elements', [])
 
-            # Clear existing data
-            cursor.execute("""
-                DELETE FROM _tool_openproject_projects 
-                WHERE connection_id = %s
-            """, (self.connection_id,))
+            # Build the statement once; only the bound values change per element
+            query = """
+                INSERT INTO _tool_openproject_projects (
+                    connection_id, id, identifier, name, description, status,
+                    is_public, parent_id, parent_name, created_at, updated_at, all_fields
+                ) VALUES (
+                    %(connection_id)s, %(id)s, %(identifier)s, %(name)s, %(description)s,
+                    %(status)s, %(is_public)s, %(parent_id)s, %(parent_name)s,
+                    %(created_at)s, %(updated_at)s, %(all_fields)s
+                )
+                ON DUPLICATE KEY UPDATE
+                    identifier = VALUES(identifier),
+                    name = VALUES(name),
+                    description = VALUES(description),
+                    status = VALUES(status),
+                    is_public = VALUES(is_public),
+                    parent_name = VALUES(parent_name),
+                    updated_at = VALUES(updated_at),
+                    all_fields = VALUES(all_fields)
+            """
 
             for element in elements:
                 # Extract parent project info
@@ -469,28 +520,12 @@ class OpenProjectExtractor:
                     'all_fields': json.dumps(element) if element else None
                 }
 
-                query = """
-                    INSERT INTO _tool_openproject_projects (
-                        connection_id, id, identifier, name, description, status,
-                        is_public, parent_id, parent_name, created_at, updated_at, all_fields
-                    ) VALUES (
-                        %(connection_id)s, %(id)s, %(identifier)s, %(name)s, %(description)s,
-                        %(status)s, %(is_public)s, %(parent_id)s, %(parent_name)s,
-                        %(created_at)s, %(updated_at)s, %(all_fields)s
-                    )
-                    ON DUPLICATE KEY UPDATE
-                        identifier = VALUES(identifier),
-                        name = VALUES(name),
-                        description = VALUES(description),
-                        status = VALUES(status),
-                        is_public = VALUES(is_public),
-                        parent_name = VALUES(parent_name),
-                        updated_at = VALUES(updated_at),
-                        all_fields = VALUES(all_fields)
-                """
-
                 cursor.execute(query, project_data)
 
+            # Remove projects that disappeared upstream
+            self._purge_stale_rows(cursor, '_tool_openproject_projects',
+                                   [e.get('id') for e in elements if e.get('id')])
+
             connection.commit()
             self.logger.info(f"Extracted {len(elements)} projects")
             return len(elements)
@@ -512,25 +547,39 @@ class OpenProjectExtractor:
         cursor = connection.cursor(dictionary=True)
 
         try:
-            cursor.execute("""
-                SELECT data FROM _raw_openproject_api_users 
-                WHERE connection_id = %s AND data IS NOT NULL
-                ORDER BY created_at DESC LIMIT 1
-            """, (self.connection_id,))
-
-            raw_record = cursor.fetchone()
-            if not raw_record:
+            raw_data = self._fetch_latest_raw(connection, '_raw_openproject_api_users')
+            if not raw_data:
                 self.logger.warning("No raw user data found")
                 return 0
 
-            data = json.loads(raw_record['data'])
+            data = json.loads(raw_data)
             elements = data.get('_embedded', {}).get('elements', [])
 
-            # Clear existing data
-            cursor.execute("""
-                DELETE FROM _tool_openproject_users 
-                WHERE connection_id = %s
-            """, (self.connection_id,))
+            # Build the statement once; only the bound values change per element
+            query = """
+                INSERT INTO _tool_openproject_users (
+                    connection_id, id, login, first_name, last_name, name, mail,
+                    admin, avatar, status, language, identity_url,
+                    created_at, updated_at, all_fields
+                ) VALUES (
+                    %(connection_id)s, %(id)s, %(login)s, %(first_name)s, %(last_name)s,
+                    %(name)s, %(mail)s, %(admin)s, %(avatar)s, %(status)s,
+                    %(language)s, %(identity_url)s, %(created_at)s, %(updated_at)s, %(all_fields)s
+                )
+                ON DUPLICATE KEY UPDATE
+                    login = VALUES(login),
+                    first_name = VALUES(first_name),
+                    last_name = VALUES(last_name),
+                    name = VALUES(name),
+                    mail = VALUES(mail),
+                    admin = VALUES(admin),
+                    avatar = VALUES(avatar),
+                    status = VALUES(status),
+                    language = VALUES(language),
+                    identity_url = VALUES(identity_url),
+                    updated_at = VALUES(updated_at),
+                    all_fields = VALUES(all_fields)
+            """
 
             for element in elements:
                 user_data = {
@@ -551,33 +600,12 @@ class OpenProjectExtractor:
                     'all_fields': json.dumps(element)
                 }
 
-                query = """
-                    INSERT INTO _tool_openproject_users (
-                        connection_id, id, login, first_name, last_name, name, mail,
-                        admin, avatar, status, language, identity_url,
-                        created_at, updated_at, all_fields
-                    ) VALUES (
-                        %(connection_id)s, %(id)s, %(login)s, %(first_name)s, %(last_name)s,
-                        %(name)s, %(mail)s, %(admin)s, %(avatar)s, %(status)s,
-                        %(language)s, %(identity_url)s, %(created_at)s, %(updated_at)s, %(all_fields)s
-                    )
-                    ON DUPLICATE KEY UPDATE
-                        login = VALUES(login),
-                        first_name = VALUES(first_name),
-                        last_name = VALUES(last_name),
-                        name = VALUES(name),
-                        mail = VALUES(mail),
-                        admin = VALUES(admin),
-                        avatar = VALUES(avatar),
-                        status = VALUES(status),
-                        language = VALUES(language),
-                        identity_url = VALUES(identity_url),
-                        updated_at = VALUES(updated_at),
-                        all_fields = VALUES(all_fields)
-                """
-
                 cursor.execute(query, user_data)
 
+            # Remove users that disappeared upstream
+            self._purge_stale_rows(cursor, '_tool_openproject_users',
+                                   [e.get('id') for e in elements if e.get('id')])
+
             connection.commit()
             self.logger.info(f"Extracted {len(elements)} users")
             return len(elements)
@@ -607,15 +635,34 @@ class OpenProjectExtractor:
 
             raw_records = cursor.fetchall()
 
-            # Clear existing data
-            cursor.execute("""
-                DELETE FROM _tool_openproject_time_entries 
-                WHERE connection_id = %s
-            """, (self.connection_id,))
-
             extracted_count = 0
             processed_te_ids = set()
 
+            # Build the statement once; only the bound values change per element
+            query = """
+                INSERT INTO _tool_openproject_time_entries (
+                    connection_id, id, hours, comment, spent_on,
+                    work_package_id, work_package_title, user_id, user_name,
+                    activity_id, activity_name, project_id, project_name,
+                    created_at, updated_at, all_fields
+                ) VALUES (
+                    %(connection_id)s, %(id)s, %(hours)s, %(comment)s, %(spent_on)s,
+                    %(work_package_id)s, %(work_package_title)s, %(user_id)s, %(user_name)s,
+                    %(activity_id)s, %(activity_name)s, %(project_id)s, %(project_name)s,
+                    %(created_at)s, %(updated_at)s, %(all_fields)s
+                )
+                ON DUPLICATE KEY UPDATE
+                    hours = VALUES(hours),
+                    comment = VALUES(comment),
+                    spent_on = VALUES(spent_on),
+                    work_package_title = VALUES(work_package_title),
+                    user_name = VALUES(user_name),
+                    activity_name = VALUES(activity_name),
+                    project_name = VALUES(project_name),
+                    updated_at = VALUES(updated_at),
+                    all_fields = VALUES(all_fields)
+            """
+
             for raw_record in raw_records:
                 try:
                     data = json.loads(raw_record['data'])
@@ -660,30 +707,6 @@ class OpenProjectExtractor:
                             'all_fields': json.dumps(element) if element else None
                         }
 
-                        query = """
-                            INSERT INTO _tool_openproject_time_entries (
-                                connection_id, id, hours, comment, spent_on,
-                                work_package_id, work_package_title, user_id, user_name,
-                                activity_id, activity_name, project_id, project_name,
-                                created_at, updated_at, all_fields
-                            ) VALUES (
-                                %(connection_id)s, %(id)s, %(hours)s, %(comment)s, %(spent_on)s,
-                                %(work_package_id)s, %(work_package_title)s, %(user_id)s, %(user_name)s,
-                                %(activity_id)s, %(activity_name)s, %(project_id)s, %(project_name)s,
-                                %(created_at)s, %(updated_at)s, %(all_fields)s
-                            )
-                            ON DUPLICATE KEY UPDATE
-                                hours = VALUES(hours),
-                                comment = VALUES(comment),
-                                spent_on = VALUES(spent_on),
-                                work_package_title = VALUES(work_package_title),
-                                user_name = VALUES(user_name),
-                                activity_name = VALUES(activity_name),
-                                project_name = VALUES(project_name),
-                                updated_at = VALUES(updated_at),
-                                all_fields = VALUES(all_fields)
-                        """
-
                         cursor.execute(query, time_entry_data)
                         processed_te_ids.add(te_id)
                         extracted_count += 1
@@ -692,6 +715,9 @@ class OpenProjectExtractor:
                     self.logger.error(f"Failed to process raw time entry record: {e}")
                     continue
 
+            # Remove time entries that disappeared upstream
+            self._purge_stale_rows(cursor, '_tool_openproject_time_entries', list(processed_te_ids))
+
             connection.commit()
             self.logger.info(f"Extracted {extracted_count} unique time entries")
             return extracted_count
@@ -737,21 +763,31 @@ class OpenProjectExtractor:
         cursor = connection.cursor(dictionary=True)
 
         try:
-            cursor.execute(f"""
-                SELECT data FROM {raw_table}
-                WHERE connection_id = %s AND data IS NOT NULL
-                ORDER BY created_at DESC LIMIT 1
-            """, (self.connection_id,))
-
-            raw_record = cursor.fetchone()
-            if not raw_record:
+            raw_data = self._fetch_latest_raw(connection, raw_table)
+            if not raw_data:
                 return 0
 
-            data = json.loads(raw_record['data'])
+            data = json.loads(raw_data)
             elements = data.get('_embedded', {}).get('elements', [])
 
-            # Clear existing data
-            cursor.execute(f"DELETE FROM {tool_table} WHERE connection_id = %s", (self.connection_id,))
+            # Build the statement once; only the bound values change per element
+            query = f"""
+                INSERT INTO {tool_table} (
+                    connection_id, id, name, is_closed, is_default, position,
+                    default_done_ratio, color, all_fields
+                ) VALUES (
+                    %(connection_id)s, %(id)s, %(name)s, %(is_closed)s, %(is_default)s,
+                    %(position)s, %(default_done_ratio)s, %(color)s, %(all_fields)s
+                )
+                ON DUPLICATE KEY UPDATE
+                    name = VALUES(name),
+                    is_closed = VALUES(is_closed),
+                    is_default = VALUES(is_default),
+                    position = VALUES(position),
+                    default_done_ratio = VALUES(default_done_ratio),
+                    color = VALUES(color),
+                    all_fields = VALUES(all_fields)
+            """
 
             for element in elements:
                 status_data = {
@@ -766,26 +802,12 @@ class OpenProjectExtractor:
                     'all_fields': json.dumps(element)
                 }
 
-                query = f"""
-                    INSERT INTO {tool_table} (
-                        connection_id, id, name, is_closed, is_default, position,
-                        default_done_ratio, color, all_fields
-                    ) VALUES (
-                        %(connection_id)s, %(id)s, %(name)s, %(is_closed)s, %(is_default)s,
-                        %(position)s, %(default_done_ratio)s, %(color)s, %(all_fields)s
-                    )
-                    ON DUPLICATE KEY UPDATE
-                        name = VALUES(name),
-                        is_closed = VALUES(is_closed),
-                        is_default = VALUES(is_default),
-                        position = VALUES(position),
-                        default_done_ratio = VALUES(default_done_ratio),
-                        color = VALUES(color),
-                        all_fields = VALUES(all_fields)
-                """
-
                 cursor.execute(query, status_data)
 
+            # Remove metadata that disappeared upstream
+            self._purge_stale_rows(cursor, tool_table,
+                                   [e.get('id') for e in elements if e.get('id')])
+
             connection.commit()
             return len(elements)
 
@@ -800,21 +822,29 @@ class OpenProjectExtractor:
         cursor = connection.cursor(dictionary=True)
 
         try:
-            cursor.execute(f"""
-                SELECT data FROM {raw_table}
-                WHERE connection_id = %s AND data IS NOT NULL
-                ORDER BY created_at DESC LIMIT 1
-            """, (self.connection_id,))
-
-            raw_record = cursor.fetchone()
-            if not raw_record:
+            raw_data = self._fetch_latest_raw(connection, raw_table)
+            if not raw_data:
                 return 0
 
-            data = json.loads(raw_record['data'])
+            data = json.loads(raw_data)
             elements = data.get('_embedded', {}).get('elements', [])
 
-            # Clear existing data
-            cursor.execute(f"DELETE FROM {tool_table} WHERE connection_id = %s", (self.connection_id,))
+            # Build the statement once; only the bound values change per element
+            query = f"""
+                INSERT INTO {tool_table} (
+                    connection_id, id, name, color, position, is_default, is_milestone, all_fields
+                ) VALUES (
+                    %(connection_id)s, %(id)s, %(name)s, %(color)s, %(position)s,
+                    %(is_default)s, %(is_milestone)s, %(all_fields)s
+                )
+                ON DUPLICATE KEY UPDATE
+                    name = VALUES(name),
+                    color = VALUES(color),
+                    position = VALUES(position),
+                    is_default = VALUES(is_default),
+                    is_milestone = VALUES(is_milestone),
+                    all_fields = VALUES(all_fields)
+            """
 
             for element in elements:
                 type_data = {
@@ -828,24 +858,12 @@ class OpenProjectExtractor:
                     'all_fields': json.dumps(element)
                 }
 
-                query = f"""
-                    INSERT INTO {tool_table} (
-                        connection_id, id, name, color, position, is_default, is_milestone, all_fields
-                    ) VALUES (
-                        %(connection_id)s, %(id)s, %(name)s, %(color)s, %(position)s,
-                        %(is_default)s, %(is_milestone)s, %(all_fields)s
-                    )
-                    ON DUPLICATE KEY UPDATE
-                        name = VALUES(name),
-                        color = VALUES(color),
-                        position = VALUES(position),
-                        is_default = VALUES(is_default),
-                        is_milestone = VALUES(is_milestone),
-                        all_fields = VALUES(all_fields)
-                """
-
                 cursor.execute(query, type_data)
 
+            # Remove metadata that disappeared upstream
+            self._purge_stale_rows(cursor, tool_table,
+                                   [e.get('id') for e in elements if e.get('id')])
+
             connection.commit()
             return len(elements)
 
@@ -860,21 +878,29 @@ class OpenProjectExtractor:
         cursor = connection.cursor(dictionary=True)
 
         try:
-            cursor.execute(f"""
-                SELECT data FROM {raw_table}
-                WHERE connection_id = %s AND data IS NOT NULL
-                ORDER BY created_at DESC LIMIT 1
-            """, (self.connection_id,))
-
-            raw_record = cursor.fetchone()
-            if not raw_record:
+            raw_data = self._fetch_latest_raw(connection, raw_table)
+            if not raw_data:
                 return 0
 
-            data = json.loads(raw_record['data'])
+            data = json.loads(raw_data)
             elements = data.get('_embedded', {}).get('elements', [])
 
-            # Clear existing data
-            cursor.execute(f"DELETE FROM {tool_table} WHERE connection_id = %s", (self.connection_id,))
+            # Build the statement once; only the bound values change per element
+            query = f"""
+                INSERT INTO {tool_table} (
+                    connection_id, id, name, position, color, is_default, is_active, all_fields
+                ) VALUES (
+                    %(connection_id)s, %(id)s, %(name)s, %(position)s, %(color)s,
+                    %(is_default)s, %(is_active)s, %(all_fields)s
+                )
+                ON DUPLICATE KEY UPDATE
+                    name = VALUES(name),
+                    position = VALUES(position),
+                    color = VALUES(color),
+                    is_default = VALUES(is_default),
+                    is_active = VALUES(is_active),
+                    all_fields = VALUES(all_fields)
+            """
 
             for element in elements:
                 priority_data = {
@@ -888,24 +914,12 @@ class OpenProjectExtractor:
                     'all_fields': json.dumps(element)
                 }
 
-                query = f"""
-                    INSERT INTO {tool_table} (
-                        connection_id, id, name, position, color, is_default, is_active, all_fields
-                    ) VALUES (
-                        %(connection_id)s, %(id)s, %(name)s, %(position)s, %(color)s,
-                        %(is_default)s, %(is_active)s, %(all_fields)s
-                    )
-                    ON DUPLICATE KEY UPDATE
-                        name = VALUES(name),
-                        position = VALUES(position),
-                        color = VALUES(color),
-                        is_default = VALUES(is_default),
-                        is_active = VALUES(is_active),
-                        all_fields = VALUES(all_fields)
-                """
-
                 cursor.execute(query, priority_data)
 
+            # Remove metadata that disappeared upstream
+            self._purge_stale_rows(cursor, tool_table,
+                                   [e.get('id') for e in elements if e.get('id')])
+
             connection.commit()
             return len(elements)
 
@@ -920,21 +934,28 @@ class OpenProjectExtractor:
         cursor = connection.cursor(dictionary=True)
 
         try:
-            cursor.execute(f"""
-                SELECT data FROM {raw_table}
-                WHERE connection_id = %s AND data IS NOT NULL
-                ORDER BY created_at DESC LIMIT 1
-            """, (self.connection_id,))
-
-            raw_record = cursor.fetchone()
-            if not raw_record:
+            raw_data = self._fetch_latest_raw(connection, raw_table)
+            if not raw_data:
                 return 0
 
-            data = json.loads(raw_record['data'])
+            data = json.loads(raw_data)
             elements = data.get('_embedded', {}).get('elements', [])
 
-            # Clear existing data
-            cursor.execute(f"DELETE FROM {tool_table} WHERE connection_id = %s", (self.connection_id,))
+            # Build the statement once; only the bound values change per element
+            query = f"""
+                INSERT INTO {tool_table} (
+                    connection_id, id, name, position, is_default, is_active, all_fields
+                ) VALUES (
+                    %(connection_id)s, %(id)s, %(name)s, %(position)s,
+                    %(is_default)s, %(is_active)s, %(all_fields)s
+                )
+                ON DUPLICATE KEY UPDATE
+                    name = VALUES(name),
+                    position = VALUES(position),
+                    is_default = VALUES(is_default),
+                    is_active = VALUES(is_active),
+                    all_fields = VALUES(all_fields)
+            """
 
             for element in elements:
                 activity_data = {
@@ -947,23 +968,12 @@ class OpenProjectExtractor:
                     'all_fields': json.dumps(element)
                 }
 
-                query = f"""
-                    INSERT INTO {tool_table} (
-                        connection_id, id, name, position, is_default, is_active, all_fields
-                    ) VALUES (
-                        %(connection_id)s, %(id)s, %(name)s, %(position)s,
-                        %(is_default)s, %(is_active)s, %(all_fields)s
-                    )
-                    ON DUPLICATE KEY UPDATE
-                        name = VALUES(name),
-                        position = VALUES(position),
-                        is_default = VALUES(is_default),
-                        is_active = VALUES(is_active),
-                        all_fields = VALUES(all_fields)
-                """
-
                 cursor.execute(query, activity_data)
 
+            # Remove metadata that disappeared upstream
+            self._purge_stale_rows(cursor, tool_table,
+                                   [e.get('id') for e in elements if e.get('id')])
+
             connection.commit()
             return len(elements)
 
@@ -13,8 +13,17 @@ Usage:
 
 import subprocess
 import sys
+import json
 import logging
+import re
 import yaml
+from collections import deque
+
+# Prefer the libyaml C loader when available (~10x faster YAML parsing)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 from pathlib import Path
 from datetime import datetime
 import argparse
@@ -48,24 +57,35 @@ def run_component(script_path, description, verbose=False, dry_run=False):
         cmd.append('--verbose')
     
     try:
-        result = subprocess.run(
+        # Stream output line by line instead of buffering it all in memory
+        # (capture_output=True holds the entire verbose run in RAM)
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
             text=True,
             cwd=Path(__file__).parent
         )
-        
+
+        tail = deque(maxlen=100)  # Keep only the last lines for reporting
+        for line in process.stdout:
+            line = line.rstrip()
+            tail.append(line)
+            if verbose:
+                logger.debug(line)
+        return_code = process.wait()
+        output = "\n".join(tail)
+
         duration = datetime.now() - start_time
-        
-        if result.returncode == 0:
+
+        if return_code == 0:
             logger.info(f"✓ Completed: {description} (took {duration})")
-            if verbose and result.stdout:
-                logger.debug(f"Output: {result.stdout[-500:]}")  # Last 500 chars
-            return True, result.returncode, result.stdout
+            return True, return_code, output
         else:
             logger.error(f"❌ Failed: {description} (took {duration})")
-            logger.error(f"Error: {result.stderr}")
-            return False, result.returncode, result.stderr
+            logger.error(f"Error: {output}")
+            return False, return_code, output
             
     except Exception as e:
         duration = datetime.now() - start_time
@@ -76,7 +96,7 @@ def load_config():
     """Load pipeline configuration"""
     config_path = Path(__file__).parent / "config.yaml"
     with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=YamlLoader)
 
 def main():
     parser = argparse.ArgumentParser(description='OpenProject DevLake Integration Pipeline')
@@ -90,6 +110,9 @@ def main():
                        help='Skip data collection (use existing raw data)')
     parser.add_argument('--skip-extraction', action='store_true',
                        help='Skip data extraction (use existing tool data)')
+    parser.add_argument('--emit-metrics-json', action='store_true',
+                       help='Print a final machine-readable JSON line with '
+                            'records and duration (used by the Streamlit UI)')
     
     args = parser.parse_args()
     
@@ -150,17 +173,19 @@ def main():
     # Execute pipeline
     start_time = datetime.now()
     failed_components = []
-    
+    component_outputs = []
+
     for i, component in enumerate(components, 1):
         logger.info(f"[{i}/{len(components)}] {component['description']}")
-        
+
         success, return_code, output = run_component(
             component['script'],
             component['description'],
             args.verbose,
             args.dry_run
         )
-        
+        component_outputs.append(output)
+
         if not success:
             failed_components.append(component['description'])
             if component['required']:
@@ -178,7 +203,17 @@ def main():
     logger.info("=" * 60)
     logger.info(f"Total Duration: {total_duration}")
     logger.info(f"Components Executed: {len(components) - len(failed_components)}/{len(components)}")
-    
+
+    if args.emit_metrics_json:
+        # One machine-readable line so callers can json.loads the metrics
+        # instead of regexing the whole log
+        match = re.search(r'Total domain records:\s*(\d+)',
+                          "\n".join(component_outputs))
+        print(json.dumps({
+            "records": int(match.group(1)) if match else 0,
+            "duration": str(total_duration)
+        }), flush=True)
+
     if failed_components:
         logger.error(f"Failed Components: {len(failed_components)}")
         for component in failed_components:
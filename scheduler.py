@@ -12,6 +12,12 @@ import sys
 from datetime import datetime
 import yaml
 
+# Prefer the libyaml C loader when available (~10x faster YAML parsing)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,7 +34,7 @@ def load_config():
     """Load configuration from config.yaml"""
     try:
         with open('config.yaml', 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
     except Exception as e:
         logger.error(f"Failed to load config.yaml: {e}")
         return None
@@ -123,7 +129,12 @@ def main():
     try:
         while True:
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            # Sleep until the next job is due instead of waking every minute
+            idle = schedule.idle_seconds()
+            if idle is None:
+                logger.info("No scheduled jobs remaining. Exiting...")
+                break
+            time.sleep(max(idle, 1))
     except KeyboardInterrupt:
         logger.info("\n👋 Scheduler stopped by user")
     except Exception as e:
@@ -0,0 +1,30 @@
+-- Composite indexes for the "latest raw payload per connection" lookup
+-- (SELECT data ... WHERE connection_id = ? ORDER BY created_at DESC LIMIT 1)
+-- so it becomes an index seek + first-row read instead of a scan + sort
+
+ALTER TABLE _raw_openproject_api_work_packages
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
+
+ALTER TABLE _raw_openproject_api_projects
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
+
+ALTER TABLE _raw_openproject_api_users
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
+
+ALTER TABLE _raw_openproject_api_time_entries
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
+
+ALTER TABLE _raw_openproject_api_statuses
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
+
+ALTER TABLE _raw_openproject_api_types
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
+
+ALTER TABLE _raw_openproject_api_priorities
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
+
+ALTER TABLE _raw_openproject_api_versions
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
+
+ALTER TABLE _raw_openproject_api_activities
+ADD INDEX IF NOT EXISTS idx_connection_created (connection_id, created_at DESC);
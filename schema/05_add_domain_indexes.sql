@@ -0,0 +1,9 @@
+-- Covering index for the DORA / team-productivity dashboard queries, which
+-- filter on status = 'DONE' and resolution_date >= <cutoff> and aggregate by
+-- type / lead_time_minutes. With all referenced columns in the index, MySQL
+-- answers these group-bys from the index B-tree without touching the rows.
+-- (id is the primary key, so the 'openproject:%' prefix filter already seeks
+-- on the clustered index.)
+
+ALTER TABLE issues
+ADD INDEX IF NOT EXISTS idx_issues_status_resolution (status, resolution_date, type, lead_time_minutes);
@@ -0,0 +1,8 @@
+-- Index for the "current active policy" lookup
+-- (WHERE is_active = TRUE ORDER BY updated_at DESC LIMIT 1) so it resolves
+-- as an index seek + first-row read instead of a full scan + filesort.
+-- sync_policies itself is created by the Streamlit app's deployment, not
+-- by database_setup.py, so this file is applied alongside it.
+
+ALTER TABLE sync_policies
+ADD INDEX IF NOT EXISTS idx_active_updated (is_active, updated_at DESC);
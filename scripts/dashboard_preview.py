@@ -5,300 +5,391 @@ Dashboard Preview - Test queries and show sample data for Grafana dashboards
 
 import mysql.connector
 import yaml
+import io
 import json
+import re
+import sys
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from tabulate import tabulate
 import argparse
 
+# Prefer the libyaml C loader when available (~10x faster YAML parsing)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Preview queries are independent read-only selects, so they can run in
+# parallel; each worker thread gets its own connection
+_thread_local = threading.local()
+
+# How many rows each preview shows
+PREVIEW_LIMIT = 5
+
+_TRAILING_LIMIT = re.compile(r'\bLIMIT\s+\d+\s*$', re.IGNORECASE)
+
+def _grid(rows, headers):
+    """Format rows as a simple grid table (previews only need alignment)"""
+    cells = [[str(v) for v in row] for row in rows]
+    widths = [max(len(h), *(len(r[i]) for r in cells)) if cells else len(h)
+              for i, h in enumerate(headers)]
+    separator = '+' + '+'.join('-' * (w + 2) for w in widths) + '+'
+
+    def _line(values):
+        return '| ' + ' | '.join(v.ljust(widths[i]) for i, v in enumerate(values)) + ' |'
+
+    lines = [separator, _line(list(headers)), separator]
+    for row in cells:
+        lines.append(_line(row))
+    lines.append(separator)
+    return '\n'.join(lines)
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.yaml"""
+    """Load configuration from config.yaml (parsed once per run)"""
     config_path = Path(__file__).parent.parent / "config.yaml"
     with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=YamlLoader)
 
 def get_db_connection(config):
     """Get database connection"""
     db_config = config['database']
+    # Compress the wire protocol: dashboard result sets are string-heavy
+    # and the LIMIT pushdown keeps the compression CPU cost small
     return mysql.connector.connect(
         host=db_config['host'],
         port=db_config['port'],
         database=db_config['database'],
         user=db_config['user'],
         password=db_config['password'],
-        charset=db_config['charset']
+        charset=db_config['charset'],
+        compress=True
     )
 
-def run_query_preview(cursor, query_name, query, limit=5):
-    """Run a query and show preview results"""
-    try:
-        cursor.execute(query)
+def _get_thread_cursor(config):
+    """Get a per-thread cursor (MySQL connections are not thread-safe)"""
+    if not hasattr(_thread_local, 'connection'):
+        _thread_local.connection = get_db_connection(config)
+        # Prepared cursors use the binary protocol, so the server parses
+        # and plans each statement text only once
+        _thread_local.cursor = _thread_local.connection.cursor(prepared=True)
+    return _thread_local.cursor
+
+def execute_query(config, query, limit=None, params=()):
+    """Execute a query on this thread's connection and fetch the results"""
+    cursor = _get_thread_cursor(config)
+
+    # Push the preview limit into the SQL when the query has none, so the
+    # server never sends rows we would only slice away client-side; fetch
+    # one extra row to detect truncation
+    if limit is not None and not _TRAILING_LIMIT.search(query.rstrip()):
+        query = f"{query.rstrip()} LIMIT {limit + 1}"
+
+    cursor.execute(query, params)
+    column_names = [desc[0] for desc in cursor.description]
+
+    if limit is not None:
+        # Bound client-side memory even when the LIMIT pushdown could not be
+        # applied: keep limit + 1 rows (the extra detects truncation) and
+        # drain the remainder without materializing it
+        results = cursor.fetchmany(limit + 1)
+        while cursor.fetchmany(1000):
+            pass
+    else:
         results = cursor.fetchall()
-        
-        if results:
-            # Get column names
-            column_names = [desc[0] for desc in cursor.description]
-            
-            # Show limited results
-            preview_results = results[:limit]
-            table = tabulate(preview_results, headers=column_names, tablefmt="grid")
-            
-            print(f"\n📊 {query_name}")
-            print("=" * 60)
-            print(f"Total rows: {len(results)}")
-            print(f"Showing first {min(limit, len(results))} rows:")
-            print(table)
-            
-            # If there are aggregation results, show the single result
-            if len(results) == 1 and len(column_names) == 1:
-                print(f"\n💡 Result: {results[0][0]}")
-                
-        else:
-            print(f"\n📊 {query_name}")
-            print("=" * 60)
-            print("⚠️  No data returned")
-            
-    except Exception as e:
-        print(f"\n❌ Error in {query_name}: {e}")
-        print(f"Query: {query}")
+    return column_names, results
+
+def run_query_preview(query_name, query, column_names, results, limit=PREVIEW_LIMIT):
+    """Show preview results for an already-executed query"""
+    # Assemble the whole block and write it once rather than a print (and
+    # stdout write syscall) per line
+    buf = io.StringIO()
+    buf.write(f"\n📊 {query_name}\n")
+    buf.write("=" * 60 + "\n")
+
+    if results:
+        # Show limited results
+        preview_results = results[:limit]
+        total_rows = f"{limit}+" if len(results) > limit else str(len(results))
+
+        buf.write(f"Total rows: {total_rows}\n")
+        buf.write(f"Showing first {min(limit, len(results))} rows:\n")
+        buf.write(_grid(preview_results, column_names) + "\n")
+
+        # If there are aggregation results, show the single result
+        if len(results) == 1 and len(column_names) == 1:
+            buf.write(f"\n💡 Result: {results[0][0]}\n")
+    else:
+        buf.write("⚠️  No data returned\n")
 
-def preview_team_productivity():
+    sys.stdout.write(buf.getvalue())
+
+def run_group_preview(executor, config, queries):
+    """Dispatch a group of queries to the pool and print results in order"""
+    # Bind the 30-day window as a parameter so the statement text stays
+    # constant and each query fills in the same cutoff
+    cutoff = datetime.utcnow() - timedelta(days=30)
+
+    futures = {
+        query_name: executor.submit(execute_query, config, query, PREVIEW_LIMIT,
+                                    (cutoff,) * query.count('%s'))
+        for query_name, query in queries.items()
+    }
+
+    for query_name, future in futures.items():
+        try:
+            column_names, results = future.result()
+            run_query_preview(query_name, queries[query_name], column_names, results)
+        except Exception as e:
+            print(f"\n❌ Error in {query_name}: {e}")
+            print(f"Query: {queries[query_name]}")
+
+def _op_range(column='id'):
+    """SARGable half-open range equivalent to LIKE 'openproject:%'"""
+    return f"{column} >= 'openproject:' AND {column} < 'openproject;'"
+
+# Query dicts are built once at import time from the shared fragments
+# above; the preview functions below just dispatch them
+TEAM_QUERIES = {
+    "Active Team Members": f"""
+        SELECT COUNT(DISTINCT assignee_name) as active_members
+        FROM issues
+        WHERE assignee_name IS NOT NULL AND assignee_name != ''
+        AND {_op_range()}
+        AND updated_date >= %s
+    """,
+
+    "Issues Completed (30 Days)": f"""
+        SELECT COUNT(*) as completed
+        FROM issues
+        WHERE status = 'DONE' AND {_op_range()}
+        AND resolution_date >= %s
+    """,
+
+    "Team Productivity by Assignee": f"""
+        SELECT assignee_name,
+               COUNT(CASE WHEN status = 'DONE' AND resolution_date >= %s THEN 1 END) as completed,
+               COUNT(CASE WHEN status IN ('TODO', 'IN_PROGRESS') THEN 1 END) as active
+        FROM issues
+        WHERE assignee_name IS NOT NULL AND assignee_name != '' AND {_op_range()}
+        GROUP BY assignee_name
+        HAVING (completed > 0 OR active > 0)
+        ORDER BY completed DESC, active DESC
+        LIMIT 10
+    """,
+
+    "Time Logging by Team Member (30 Days)": f"""
+        SELECT a.full_name as author_name, ROUND(SUM(w.time_spent_minutes)/60, 1) as hours_logged
+        FROM (
+            SELECT author_id, time_spent_minutes
+            FROM issue_worklogs
+            WHERE {_op_range()}
+            AND logged_date >= %s
+        ) w
+        INNER JOIN accounts a ON w.author_id = a.id
+        WHERE a.full_name IS NOT NULL AND a.full_name != ''
+        GROUP BY a.full_name
+        ORDER BY hours_logged DESC
+        LIMIT 10
+    """
+}
+
+def preview_team_productivity(executor, config):
     """Preview Team Productivity dashboard queries"""
-    config = load_config()
-    connection = get_db_connection(config)
-    cursor = connection.cursor()
-    
     print("🏃‍♂️ TEAM PRODUCTIVITY DASHBOARD PREVIEW")
     print("=" * 70)
-    
-    queries = {
-        "Active Team Members": """
-            SELECT COUNT(DISTINCT assignee_name) as active_members 
-            FROM issues 
-            WHERE assignee_name IS NOT NULL AND assignee_name != '' 
-            AND id LIKE 'openproject:%' 
-            AND updated_date >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-        """,
-        
-        "Issues Completed (30 Days)": """
-            SELECT COUNT(*) as completed 
-            FROM issues 
-            WHERE status = 'DONE' AND id LIKE 'openproject:%' 
-            AND resolution_date >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-        """,
-        
-        "Team Productivity by Assignee": """
-            SELECT assignee_name, 
-                   COUNT(CASE WHEN status = 'DONE' AND resolution_date >= DATE_SUB(NOW(), INTERVAL 30 DAY) THEN 1 END) as completed,
-                   COUNT(CASE WHEN status IN ('TODO', 'IN_PROGRESS') THEN 1 END) as active
-            FROM issues 
-            WHERE assignee_name IS NOT NULL AND assignee_name != '' AND id LIKE 'openproject:%' 
-            GROUP BY assignee_name 
-            HAVING (completed > 0 OR active > 0) 
-            ORDER BY completed DESC, active DESC 
-            LIMIT 10
-        """,
-        
-        "Time Logging by Team Member (30 Days)": """
-            SELECT a.full_name as author_name, ROUND(SUM(w.time_spent_minutes)/60, 1) as hours_logged 
-            FROM issue_worklogs w 
-            LEFT JOIN accounts a ON w.author_id = a.id
-            WHERE w.id LIKE 'openproject:%' 
-            AND w.logged_date >= DATE_SUB(NOW(), INTERVAL 30 DAY) 
-            AND a.full_name IS NOT NULL AND a.full_name != '' 
-            GROUP BY a.full_name 
-            ORDER BY hours_logged DESC 
-            LIMIT 10
-        """
-    }
-    
-    for query_name, query in queries.items():
-        run_query_preview(cursor, query_name, query)
-    
-    cursor.close()
-    connection.close()
-
-def preview_sprint_progress():
+
+    run_group_preview(executor, config, TEAM_QUERIES)
+
+SPRINT_QUERIES = {
+    "Project Health Overview": """
+        SELECT b.name as 'Project',
+               COUNT(i.id) as 'Total Issues',
+               COUNT(CASE WHEN i.status = 'DONE' THEN 1 END) as 'Completed',
+               COUNT(CASE WHEN i.status IN ('TODO', 'IN_PROGRESS') THEN 1 END) as 'Active',
+               ROUND((COUNT(CASE WHEN i.status = 'DONE' THEN 1 END) * 100.0) / NULLIF(COUNT(i.id), 0), 1) as 'Completion %'
+        FROM boards b
+        LEFT JOIN board_issues bi ON b.id = bi.board_id
+        LEFT JOIN issues i ON bi.issue_id = i.id
+        WHERE b.type = 'openproject'
+        GROUP BY b.id, b.name
+        ORDER BY `Total Issues` DESC
+    """,
+
+    "Sprint Progress (Version-based)": f"""
+        SELECT COALESCE(s.name, 'No Sprint') as 'Sprint/Version',
+               COUNT(i.id) as 'Total Issues',
+               COUNT(CASE WHEN i.status = 'DONE' THEN 1 END) as 'Completed',
+               ROUND((COUNT(CASE WHEN i.status = 'DONE' THEN 1 END) * 100.0) / NULLIF(COUNT(i.id), 0), 1) as 'Progress %'
+        FROM issues i
+        LEFT JOIN sprint_issues si ON i.id = si.issue_id
+        LEFT JOIN sprints s ON si.sprint_id = s.id
+        WHERE {_op_range('i.id')}
+        GROUP BY s.name
+        ORDER BY `Progress %` DESC, `Total Issues` DESC
+        LIMIT 10
+    """,
+
+    "Issue Priority Distribution": f"""
+        SELECT priority,
+               COUNT(CASE WHEN status IN ('TODO', 'IN_PROGRESS') THEN 1 END) as active_count,
+               COUNT(CASE WHEN status = 'DONE' THEN 1 END) as completed_count
+        FROM issues
+        WHERE {_op_range()} AND priority IS NOT NULL AND priority != ''
+        GROUP BY priority
+        ORDER BY active_count DESC
+    """
+}
+
+def preview_sprint_progress(executor, config):
     """Preview Sprint Progress dashboard queries"""
-    config = load_config()
-    connection = get_db_connection(config)
-    cursor = connection.cursor()
-    
     print("\n\n🏃‍♀️ SPRINT PROGRESS & PROJECTS DASHBOARD PREVIEW")
     print("=" * 70)
-    
-    queries = {
-        "Project Health Overview": """
-            SELECT b.name as 'Project', 
-                   COUNT(i.id) as 'Total Issues', 
-                   COUNT(CASE WHEN i.status = 'DONE' THEN 1 END) as 'Completed',
-                   COUNT(CASE WHEN i.status IN ('TODO', 'IN_PROGRESS') THEN 1 END) as 'Active',
-                   ROUND((COUNT(CASE WHEN i.status = 'DONE' THEN 1 END) * 100.0) / NULLIF(COUNT(i.id), 0), 1) as 'Completion %'
-            FROM boards b 
-            LEFT JOIN board_issues bi ON b.id = bi.board_id 
-            LEFT JOIN issues i ON bi.issue_id = i.id 
-            WHERE b.type = 'openproject' 
-            GROUP BY b.id, b.name 
-            ORDER BY 'Total Issues' DESC
-        """,
-        
-        "Sprint Progress (Version-based)": """
-            SELECT COALESCE(s.name, 'No Sprint') as 'Sprint/Version', 
-                   COUNT(i.id) as 'Total Issues', 
-                   COUNT(CASE WHEN i.status = 'DONE' THEN 1 END) as 'Completed',
-                   ROUND((COUNT(CASE WHEN i.status = 'DONE' THEN 1 END) * 100.0) / NULLIF(COUNT(i.id), 0), 1) as 'Progress %'
-            FROM issues i 
-            LEFT JOIN sprint_issues si ON i.id = si.issue_id 
-            LEFT JOIN sprints s ON si.sprint_id = s.id
-            WHERE i.id LIKE 'openproject:%' 
-            GROUP BY s.name 
-            ORDER BY 'Progress %' DESC, 'Total Issues' DESC 
-            LIMIT 10
-        """,
-        
-        "Issue Priority Distribution": """
-            SELECT priority, 
-                   COUNT(CASE WHEN status IN ('TODO', 'IN_PROGRESS') THEN 1 END) as active_count,
-                   COUNT(CASE WHEN status = 'DONE' THEN 1 END) as completed_count
-            FROM issues 
-            WHERE id LIKE 'openproject:%' AND priority IS NOT NULL AND priority != '' 
-            GROUP BY priority 
-            ORDER BY active_count DESC
-        """
-    }
-    
-    for query_name, query in queries.items():
-        run_query_preview(cursor, query_name, query)
-    
-    cursor.close()
-    connection.close()
-
-def preview_dora_metrics():
+
+    run_group_preview(executor, config, SPRINT_QUERIES)
+
+DORA_QUERIES = {
+    "Lead Time for Changes (Days)": f"""
+        SELECT ROUND(AVG(lead_time_minutes)/1440, 1) as avg_lead_time_days
+        FROM issues
+        WHERE status = 'DONE' AND {_op_range()}
+        AND resolution_date >= %s
+        AND lead_time_minutes IS NOT NULL
+    """,
+
+    "Change Failure Rate": f"""
+        SELECT ROUND((SUM(CASE WHEN type = 'BUG' THEN 1 ELSE 0 END) * 100.0) / NULLIF(COUNT(*), 0), 1) as failure_rate
+        FROM issues
+        WHERE status = 'DONE' AND {_op_range()}
+        AND resolution_date >= %s
+    """,
+
+    "Issue Metrics by Type": f"""
+        SELECT type as 'Issue Type',
+               COUNT(*) as 'Total',
+               COUNT(CASE WHEN status = 'DONE' THEN 1 END) as 'Completed',
+               ROUND((COUNT(CASE WHEN status = 'DONE' THEN 1 END) * 100.0) / NULLIF(COUNT(*), 0), 1) as 'Completion %',
+               ROUND(AVG(CASE WHEN status = 'DONE' AND lead_time_minutes IS NOT NULL THEN lead_time_minutes END)/1440, 1) as 'Avg Lead Time (Days)'
+        FROM issues
+        WHERE {_op_range()}
+        GROUP BY type
+        ORDER BY `Total` DESC
+    """,
+
+    "Time Logging Analysis by Project": f"""
+        SELECT i.original_project as 'Project',
+               COUNT(w.id) as 'Worklogs',
+               ROUND(SUM(w.time_spent_minutes)/60, 1) as 'Total Hours',
+               COUNT(DISTINCT w.author_id) as 'Contributors'
+        FROM issues i
+        INNER JOIN issue_worklogs w ON i.id = w.issue_id
+        WHERE {_op_range('i.id')}
+        GROUP BY i.original_project
+        ORDER BY `Total Hours` DESC
+    """
+}
+
+# One conditional-aggregation query per base table: the issues counts
+# share a single scan instead of three, and six round-trips become three
+COUNT_QUERIES = {
+    'issues': f"""
+        SELECT COUNT(*) as total,
+               SUM(status IN ('TODO', 'IN_PROGRESS')) as active,
+               SUM(status = 'DONE') as completed
+        FROM issues
+        WHERE {_op_range()}
+    """,
+    'boards': "SELECT COUNT(*) FROM boards WHERE type = 'openproject'",
+    'issue_worklogs': f"SELECT COUNT(*) FROM issue_worklogs WHERE {_op_range()}",
+    'accounts': f"SELECT COUNT(*) FROM accounts WHERE {_op_range()}",
+}
+
+def preview_dora_metrics(executor, config):
     """Preview DORA Metrics dashboard queries"""
-    config = load_config()
-    connection = get_db_connection(config)
-    cursor = connection.cursor()
-    
     print("\n\n📈 ISSUES METRICS & DORA DASHBOARD PREVIEW")
     print("=" * 70)
-    
-    queries = {
-        "Lead Time for Changes (Days)": """
-            SELECT ROUND(AVG(lead_time_minutes)/1440, 1) as avg_lead_time_days 
-            FROM issues 
-            WHERE status = 'DONE' AND id LIKE 'openproject:%' 
-            AND resolution_date >= DATE_SUB(NOW(), INTERVAL 30 DAY) 
-            AND lead_time_minutes IS NOT NULL
-        """,
-        
-        "Change Failure Rate": """
-            SELECT ROUND((SUM(CASE WHEN type = 'BUG' THEN 1 ELSE 0 END) * 100.0) / NULLIF(COUNT(*), 0), 1) as failure_rate 
-            FROM issues 
-            WHERE status = 'DONE' AND id LIKE 'openproject:%' 
-            AND resolution_date >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-        """,
-        
-        "Issue Metrics by Type": """
-            SELECT type as 'Issue Type', 
-                   COUNT(*) as 'Total', 
-                   COUNT(CASE WHEN status = 'DONE' THEN 1 END) as 'Completed',
-                   ROUND((COUNT(CASE WHEN status = 'DONE' THEN 1 END) * 100.0) / NULLIF(COUNT(*), 0), 1) as 'Completion %',
-                   ROUND(AVG(CASE WHEN status = 'DONE' AND lead_time_minutes IS NOT NULL THEN lead_time_minutes END)/1440, 1) as 'Avg Lead Time (Days)'
-            FROM issues 
-            WHERE id LIKE 'openproject:%' 
-            GROUP BY type 
-            ORDER BY 'Total' DESC
-        """,
-        
-        "Time Logging Analysis by Project": """
-            SELECT i.original_project as 'Project', 
-                   COUNT(w.id) as 'Worklogs', 
-                   ROUND(SUM(w.time_spent_minutes)/60, 1) as 'Total Hours',
-                   COUNT(DISTINCT w.author_id) as 'Contributors'
-            FROM issues i 
-            LEFT JOIN issue_worklogs w ON i.id = w.issue_id 
-            WHERE i.id LIKE 'openproject:%' AND w.id IS NOT NULL 
-            GROUP BY i.original_project 
-            ORDER BY 'Total Hours' DESC
-        """
-    }
-    
-    for query_name, query in queries.items():
-        run_query_preview(cursor, query_name, query)
-    
-    cursor.close()
-    connection.close()
-
-def show_data_summary():
+
+    run_group_preview(executor, config, DORA_QUERIES)
+
+def show_data_summary(executor, config):
     """Show overall data summary"""
-    config = load_config()
-    connection = get_db_connection(config)
-    cursor = connection.cursor()
-    
-    print("📊 DATA SUMMARY")
-    print("=" * 50)
-    
-    # Get data counts
-    tables_to_check = [
-        ('Issues (Total)', 'issues', "WHERE id LIKE 'openproject:%'"),
-        ('Issues (Active)', 'issues', "WHERE id LIKE 'openproject:%' AND status IN ('TODO', 'IN_PROGRESS')"),
-        ('Issues (Completed)', 'issues', "WHERE id LIKE 'openproject:%' AND status = 'DONE'"),
-        ('Boards/Projects', 'boards', "WHERE type = 'openproject'"),
-        ('Worklogs', 'issue_worklogs', "WHERE id LIKE 'openproject:%'"),
-        ('Accounts/Users', 'accounts', "WHERE id LIKE 'openproject:%'"),
-    ]
-    
+    buf = io.StringIO()
+    buf.write("📊 DATA SUMMARY\n")
+    buf.write("=" * 50 + "\n")
+
+    futures = {
+        table: executor.submit(execute_query, config, query)
+        for table, query in COUNT_QUERIES.items()
+    }
+
     summary_data = []
-    for label, table, where_clause in tables_to_check:
+    try:
+        _, results = futures['issues'].result()
+        total, active, completed = results[0]
+        summary_data.append(['Issues (Total)', f"{int(total or 0):,}"])
+        summary_data.append(['Issues (Active)', f"{int(active or 0):,}"])
+        summary_data.append(['Issues (Completed)', f"{int(completed or 0):,}"])
+    except Exception as e:
+        summary_data.append(['Issues', f"Error: {e}"])
+
+    for label, table in [('Boards/Projects', 'boards'),
+                         ('Worklogs', 'issue_worklogs'),
+                         ('Accounts/Users', 'accounts')]:
         try:
-            query = f"SELECT COUNT(*) FROM {table} {where_clause}"
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            summary_data.append([label, f"{count:,}"])
+            _, results = futures[table].result()
+            summary_data.append([label, f"{results[0][0]:,}"])
         except Exception as e:
             summary_data.append([label, f"Error: {e}"])
-    
-    print(tabulate(summary_data, headers=['Data Type', 'Count'], tablefmt='grid'))
-    
-    cursor.close()
-    connection.close()
+
+    buf.write(_grid(summary_data, ['Data Type', 'Count']) + "\n")
+    sys.stdout.write(buf.getvalue())
 
 def main():
     parser = argparse.ArgumentParser(description='Preview Grafana dashboard data')
-    parser.add_argument('--dashboard', choices=['team', 'sprint', 'dora', 'all'], 
+    parser.add_argument('--dashboard', choices=['team', 'sprint', 'dora', 'all'],
                        default='all', help='Which dashboard to preview')
-    parser.add_argument('--summary', action='store_true', 
+    parser.add_argument('--summary', action='store_true',
                        help='Show data summary only')
-    
+
     args = parser.parse_args()
-    
+
+    # Parse config once; worker threads open their own connections on demand
+    config = load_config()
+
     try:
-        if args.summary:
-            show_data_summary()
-            return
-            
-        if args.dashboard in ['team', 'all']:
-            preview_team_productivity()
-            
-        if args.dashboard in ['sprint', 'all']:
-            preview_sprint_progress()
-            
-        if args.dashboard in ['dora', 'all']:
-            preview_dora_metrics()
-            
-        print("\n" + "=" * 70)
-        print("🎯 PREVIEW COMPLETE")
-        print("=" * 70)
-        print("✅ All queries executed successfully!")
-        print("\n🚀 Next Steps:")
-        print("1. Run the Grafana setup script to create dashboards")
-        print("2. Customize queries and visualizations as needed")
-        print("3. Set up alerts and monitoring")
-        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            if args.summary:
+                show_data_summary(executor, config)
+                return
+
+            if args.dashboard in ['team', 'all']:
+                preview_team_productivity(executor, config)
+
+            if args.dashboard in ['sprint', 'all']:
+                preview_sprint_progress(executor, config)
+
+            if args.dashboard in ['dora', 'all']:
+                preview_dora_metrics(executor, config)
+
+        sys.stdout.write(
+            "\n" + "=" * 70 + "\n"
+            "🎯 PREVIEW COMPLETE\n"
+            + "=" * 70 + "\n"
+            "✅ All queries executed successfully!\n"
+            "\n🚀 Next Steps:\n"
+            "1. Run the Grafana setup script to create dashboards\n"
+            "2. Customize queries and visualizations as needed\n"
+            "3. Set up alerts and monitoring\n"
+        )
+
     except Exception as e:
         print(f"\n❌ Error during preview: {e}")
         return 1
-    
+
     return 0
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(main())
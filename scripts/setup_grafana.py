@@ -4,12 +4,33 @@ Grafana setup script for OpenProject DevLake integration
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import io
 import json
 import yaml
+
+# Prefer ijson so the dashboard title can be streamed out of large
+# dashboard files without parsing every panel up front
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson serializes nested dashboard dicts several times faster than
+# stdlib json; fall back to json.dumps when it is not installed
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import time
 import sys
 
 class GrafanaSetup:
@@ -27,13 +48,33 @@ class GrafanaSetup:
             'Accept': 'application/json'
         })
 
+        # Pool connections to the single Grafana host and retry transient
+        # gateway errors with backoff instead of pacing requests with sleeps
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Lazily-built map of dashboard title -> search entry, so a batch of
+        # uploads issues one /api/search call instead of one per dashboard
+        self._dashboard_index = None
+
+        # Folder and datasource listings are likewise fetched once per run
+        self._folders_cache = None
+        self._datasources_cache = None
+
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
         self.logger = logging.getLogger(__name__)
 
     def test_connection(self):
         """Test connection to Grafana"""
         try:
-            response = self.session.get(f"{self.grafana_url}/api/health")
+            # Only the status code matters here; skip the body transfer
+            response = self.session.head(f"{self.grafana_url}/api/health")
             response.raise_for_status()
             self.logger.info("✅ Grafana connection successful")
             return True
@@ -49,24 +90,32 @@ class GrafanaSetup:
 
             datasource = config['datasources'][0]
 
-            # Check if datasource already exists
-            response = self.session.get(f"{self.grafana_url}/api/datasources/name/{datasource['name']}")
+            # Check if datasource already exists (list fetched once per run)
+            if self._datasources_cache is None:
+                response = self.session.get(f"{self.grafana_url}/api/datasources")
+                if response.status_code == 200:
+                    self._datasources_cache = {d['name']: d for d in response.json()}
+                else:
+                    self._datasources_cache = {}
 
-            if response.status_code == 200:
+            existing_datasource = self._datasources_cache.get(datasource['name'])
+
+            if existing_datasource:
                 self.logger.info(f"Datasource '{datasource['name']}' already exists, updating...")
-                datasource_id = response.json()['id']
                 response = self.session.put(
-                    f"{self.grafana_url}/api/datasources/{datasource_id}",
-                    json=datasource
+                    f"{self.grafana_url}/api/datasources/{existing_datasource['id']}",
+                    data=_json_dumps(datasource)
                 )
             else:
                 self.logger.info(f"Creating datasource '{datasource['name']}'...")
                 response = self.session.post(
                     f"{self.grafana_url}/api/datasources",
-                    json=datasource
+                    data=_json_dumps(datasource)
                 )
 
             if response.status_code in [200, 201]:
+                # Drop the cache so the next lookup sees the new/updated entry
+                self._datasources_cache = None
                 self.logger.info("✅ Datasource configured successfully")
                 return True
             else:
@@ -76,40 +125,66 @@ class GrafanaSetup:
             self.logger.error(f"❌ Error configuring datasource: {e}")
             return False
 
+    def _get_dashboard_index(self):
+        """Fetch all existing dashboards once and index them by title"""
+        if self._dashboard_index is None:
+            response = self.session.get(
+                f"{self.grafana_url}/api/search",
+                params={'type': 'dash-db'}
+            )
+            if response.status_code == 200:
+                self._dashboard_index = {d['title']: d for d in response.json()}
+            else:
+                self._dashboard_index = {}
+        return self._dashboard_index
+
     def create_dashboard(self, dashboard_path: str):
         """Create dashboard from JSON file"""
         try:
-            with open(dashboard_path, 'r') as f:
-                dashboard_config = json.load(f)
+            with open(dashboard_path, 'rb') as f:
+                raw_config = f.read()
 
-            dashboard_title = dashboard_config['dashboard']['title']
+            dashboard_config = None
+            if ijson is not None:
+                dashboard_title = next(
+                    ijson.items(io.BytesIO(raw_config), 'dashboard.title'), None)
+            else:
+                dashboard_title = None
 
-            # Check if dashboard already exists
-            search_response = self.session.get(
-                f"{self.grafana_url}/api/search",
-                params={'query': dashboard_title}
-            )
+            if dashboard_title is None:
+                dashboard_config = json.loads(raw_config)
+                dashboard_title = dashboard_config['dashboard']['title']
 
-            if search_response.status_code == 200:
-                existing_dashboards = search_response.json()
-                existing_dashboard = next(
-                    (d for d in existing_dashboards if d['title'] == dashboard_title),
-                    None
+            # Check if dashboard already exists
+            existing_dashboard = self._get_dashboard_index().get(dashboard_title)
+
+            if existing_dashboard:
+                self.logger.info(f"Dashboard '{dashboard_title}' already exists, updating...")
+                if dashboard_config is None:
+                    dashboard_config = json.loads(raw_config)
+                dashboard_config['dashboard']['id'] = existing_dashboard['id']
+                dashboard_config['dashboard']['version'] = existing_dashboard.get('version', 1) + 1
+
+            # Create/update dashboard; a brand-new dashboard needs no id or
+            # version injected, so the file bytes are sent as-is unparsed
+            if dashboard_config is not None:
+                response = self.session.post(
+                    f"{self.grafana_url}/api/dashboards/db",
+                    data=_json_dumps(dashboard_config)
+                )
+            else:
+                response = self.session.post(
+                    f"{self.grafana_url}/api/dashboards/db",
+                    data=raw_config
                 )
-
-                if existing_dashboard:
-                    self.logger.info(f"Dashboard '{dashboard_title}' already exists, updating...")
-                    dashboard_config['dashboard']['id'] = existing_dashboard['id']
-                    dashboard_config['dashboard']['version'] = existing_dashboard.get('version', 1) + 1
-
-            # Create/update dashboard
-            response = self.session.post(
-                f"{self.grafana_url}/api/dashboards/db",
-                json=dashboard_config
-            )
 
             if response.status_code == 200:
                 result = response.json()
+                self._get_dashboard_index()[dashboard_title] = {
+                    'id': result['id'],
+                    'title': dashboard_title,
+                    'version': result.get('version', 1)
+                }
                 dashboard_url = f"{self.grafana_url}/d/{result['uid']}/{result['slug']}"
                 self.logger.info(f"✅ Dashboard '{dashboard_title}' created/updated")
                 self.logger.info(f"   URL: {dashboard_url}")
@@ -124,19 +199,22 @@ class GrafanaSetup:
     def create_folder(self, folder_name: str):
         """Create folder for organizing dashboards"""
         try:
-            # Check if folder already exists
-            response = self.session.get(f"{self.grafana_url}/api/folders")
-
-            if response.status_code == 200:
-                existing_folders = response.json()
-                existing_folder = next(
-                    (f for f in existing_folders if f['title'] == folder_name),
-                    None
-                )
+            # Check if folder already exists (list fetched once per run)
+            if self._folders_cache is None:
+                response = self.session.get(f"{self.grafana_url}/api/folders")
+                if response.status_code == 200:
+                    self._folders_cache = response.json()
+                else:
+                    self._folders_cache = []
+
+            existing_folder = next(
+                (f for f in self._folders_cache if f['title'] == folder_name),
+                None
+            )
 
-                if existing_folder:
-                    self.logger.info(f"Folder '{folder_name}' already exists")
-                    return existing_folder['uid']
+            if existing_folder:
+                self.logger.info(f"Folder '{folder_name}' already exists")
+                return existing_folder['uid']
 
             # Create folder
             folder_data = {
@@ -146,11 +224,12 @@ class GrafanaSetup:
 
             response = self.session.post(
                 f"{self.grafana_url}/api/folders",
-                json=folder_data
+                data=_json_dumps(folder_data)
             )
 
             if response.status_code == 200:
                 result = response.json()
+                self._folders_cache.append(result)
                 self.logger.info(f"✅ Folder '{folder_name}' created")
                 return result['uid']
             else:
@@ -194,11 +273,16 @@ class GrafanaSetup:
         if not dashboard_files:
             self.logger.warning("❌ No dashboard files found")
         else:
-            dashboard_success = 0
-            for dashboard_file in dashboard_files:
-                if self.create_dashboard(str(dashboard_file)):
-                    dashboard_success += 1
-                time.sleep(1)  # Small delay between dashboard creation
+            # Warm the dashboard index before fanning out so the workers
+            # share one /api/search result instead of racing to build it
+            self._get_dashboard_index()
+
+            # Upload dashboards concurrently; each POST is independent and the
+            # session pool hands each worker its own connection
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = executor.map(self.create_dashboard,
+                                       (str(f) for f in dashboard_files))
+                dashboard_success = sum(results)
 
             if dashboard_success > 0:
                 success_count += 1
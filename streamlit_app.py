@@ -5,16 +5,60 @@ Web interface for configuring sync policies and scheduling data collection
 """
 
 import streamlit as st
-import mysql.connector
+from mysql.connector.pooling import MySQLConnectionPool
 import yaml
 from datetime import datetime, timedelta
-from pathlib import Path
+from dateutil.rrule import rrule, MONTHLY
 import pandas as pd
-import subprocess
+import asyncio
+import base64
+import json
+import requests
+from requests.adapters import HTTPAdapter
 import sys
 import re
+import time
 from typing import Dict, Optional, List
 
+# connectorx transfers query results via Arrow, skipping the per-row
+# Python tuple intermediate that pd.read_sql goes through
+try:
+    import connectorx
+except ImportError:
+    connectorx = None
+
+# Prefer the libyaml C loader when available (~10x faster YAML parsing)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# croniter powers the 'custom' frequency preview; without it custom
+# schedules simply show no upcoming runs
+try:
+    from croniter import croniter
+except ImportError:
+    croniter = None
+
+# Shared session for OpenProject health checks: keeps the TCP/TLS
+# connection alive across Streamlit reruns instead of handshaking anew
+# on every sidebar render
+_OP_SESSION = requests.Session()
+_op_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_OP_SESSION.mount('http://', _op_adapter)
+_OP_SESSION.mount('https://', _op_adapter)
+
+# Tables whose names may be interpolated into count statements; table
+# names cannot be bound as query parameters
+_COUNTABLE_TABLES = frozenset({
+    'issues', 'boards', 'board_issues', 'issue_worklogs',
+    'accounts', 'sprints', 'sprint_issues'
+})
+
+# The tables the sidebar and post-pipeline fallback both count; a shared
+# constant keeps their cache keys identical so they hit one cache entry
+_COUNTED_TABLES = ('issues', 'boards', 'board_issues', 'issue_worklogs', 'accounts')
+
 # Page configuration
 st.set_page_config(
     page_title="OpenProject DevLake Sync",
@@ -26,30 +70,52 @@ st.set_page_config(
 
 class SyncPolicyManager:
     """Manages sync policies in MySQL database"""
-    
+
+    # Shared connection pool, built lazily on first use. Every Streamlit
+    # rerun hits the database several times, and a pooled connection skips
+    # the TCP + auth handshake each of those calls would otherwise pay.
+    _pool: Optional[MySQLConnectionPool] = None
+
     def __init__(self, config: Dict):
         self.config = config
         self.db_config = config['database']
-    
+
     def get_connection(self):
-        """Create database connection"""
-        return mysql.connector.connect(
-            host=self.db_config['host'],
-            port=self.db_config['port'],
-            database=self.db_config['database'],
-            user=self.db_config['user'],
-            password=self.db_config['password'],
-            charset=self.db_config['charset']
-        )
-    
+        """Get a pooled database connection (returned to the pool on close)"""
+        if SyncPolicyManager._pool is None:
+            SyncPolicyManager._pool = MySQLConnectionPool(
+                pool_name="devlake",
+                pool_size=8,
+                pool_reset_session=True,
+                host=self.db_config['host'],
+                port=self.db_config['port'],
+                database=self.db_config['database'],
+                user=self.db_config['user'],
+                password=self.db_config['password'],
+                charset=self.db_config['charset']
+            )
+        return SyncPolicyManager._pool.get_connection()
+
+    def _cache_key(self) -> str:
+        """Hashable fingerprint of the target database for st.cache_data"""
+        return f"{self.db_config['host']}:{self.db_config['port']}/{self.db_config['database']}"
+
     def get_current_policy(self) -> Optional[Dict]:
+        """Get current sync policy (cached across reruns)"""
+        return _cached_policy(self._cache_key(), self)
+
+    def _query_current_policy(self) -> Optional[Dict]:
         """Get current sync policy from database"""
+        # Explicit column list (paired with the idx_active_updated index in
+        # schema/06) so the filter + ordering resolve in one index step
         with self.get_connection() as conn:
             with conn.cursor(dictionary=True) as cursor:
                 cursor.execute("""
-                    SELECT * FROM sync_policies 
-                    WHERE is_active = TRUE 
-                    ORDER BY updated_at DESC 
+                    SELECT id, time_range_start, time_range_end, sync_frequency,
+                           custom_cron, skip_failed_tasks, updated_at
+                    FROM sync_policies
+                    WHERE is_active = TRUE
+                    ORDER BY updated_at DESC
                     LIMIT 1
                 """)
                 return cursor.fetchone()
@@ -58,8 +124,12 @@ class SyncPolicyManager:
         """Save sync policy to database"""
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("UPDATE sync_policies SET is_active = FALSE")
+                with conn.cursor(prepared=True) as cursor:
+                    # Only the currently active row needs deactivating;
+                    # touching every historical row rewrote (and locked)
+                    # the whole table on each save
+                    cursor.execute(
+                        "UPDATE sync_policies SET is_active = FALSE WHERE is_active = TRUE")
                     cursor.execute("""
                         INSERT INTO sync_policies (
                             time_range_start, time_range_end, sync_frequency, 
@@ -74,34 +144,70 @@ class SyncPolicyManager:
                         policy['skip_failed_tasks'],
                     ))
                 conn.commit()
+            # The cached policy (and anything derived from it) is now stale
+            _cached_policy.clear()
             return True
         except Exception as e:
             st.error(f"Error saving policy: {e}")
             return False
 
     def get_execution_history(self, limit: int = 10) -> pd.DataFrame:
+        """Get recent execution history (cached across reruns)"""
+        return _cached_history(self._cache_key(), self, limit)
+
+    def _mysql_url(self) -> str:
+        """Connection URL for connectorx"""
+        db = self.db_config
+        return f"mysql://{db['user']}:{db['password']}@{db['host']}:{db['port']}/{db['database']}"
+
+    def _query_execution_history(self, limit: int) -> pd.DataFrame:
         """Get recent execution history"""
-        with self.get_connection() as conn:
-            return pd.read_sql("""
-                SELECT id, started_at, completed_at, status, records_collected,
-                       error_message, TIMESTAMPDIFF(SECOND, started_at, completed_at) as duration_seconds
-                FROM sync_execution_history 
-                ORDER BY started_at DESC 
-                LIMIT %s
-            """, conn, params=(limit,))
+        # connectorx does not bind parameters, so the limit is inlined
+        # (int() keeps it safe)
+        query = f"""
+            SELECT id, started_at, completed_at, status, records_collected,
+                   error_message, TIMESTAMPDIFF(SECOND, started_at, completed_at) as duration_seconds
+            FROM sync_execution_history
+            ORDER BY started_at DESC
+            LIMIT {int(limit)}
+        """
+        if connectorx is not None:
+            history = connectorx.read_sql(self._mysql_url(), query, return_type="pandas")
+        else:
+            with self.get_connection() as conn:
+                history = pd.read_sql(query, conn)
+
+        # Arrow-backed dtypes: st.dataframe serializes to Arrow anyway, and
+        # the object-dtype status/error_message columns are what dominate
+        # the DataFrame's memory and serialization cost
+        return history.convert_dtypes(dtype_backend="pyarrow")
 
     def get_table_counts(self, tables: List[str]) -> Dict[str, int]:
-        """Get record counts for multiple tables efficiently"""
-        counts = {}
-        with self.get_connection() as conn:
-            with conn.cursor(dictionary=True) as cursor:
-                for table in tables:
-                    try:
-                        cursor.execute(f"SELECT COUNT(*) AS c FROM {table}")
-                        row = cursor.fetchone()
-                        counts[table] = int(row.get('c', 0)) if row else 0
-                    except Exception:
-                        counts[table] = 0
+        """Get record counts for multiple tables (cached across reruns)"""
+        return _cached_counts(self._cache_key(), self, tuple(tables))
+
+    def _query_table_counts(self, tables: List[str]) -> Dict[str, int]:
+        """Get record counts for multiple tables in one round-trip"""
+        counts = {table: 0 for table in tables}
+        safe_tables = [t for t in tables if t in _COUNTABLE_TABLES]
+
+        if safe_tables:
+            # One UNION ALL statement instead of a query per table: MySQL
+            # still counts each table independently, but the results come
+            # back in a single network round-trip
+            union_sql = " UNION ALL ".join(
+                f"SELECT '{t}' AS table_name, COUNT(*) AS c FROM `{t}`"
+                for t in safe_tables
+            )
+            try:
+                with self.get_connection() as conn:
+                    with conn.cursor() as cursor:
+                        cursor.execute(union_sql)
+                        for table_name, count in cursor.fetchall():
+                            counts[table_name] = int(count)
+            except Exception:
+                pass
+
         counts['total'] = sum(counts.values())
         return counts
     
@@ -112,91 +218,194 @@ class SyncPolicyManager:
             return []
         
         frequency = policy['sync_frequency']
-        now = datetime.now()
-        
+        # Schedules are defined in UTC (see the frequency labels)
+        now = datetime.utcnow()
+
         if frequency == 'manual':
             return [{'date': 'Manual', 'note': 'Run manually when needed'}]
-        
-        runs = []
-        
-        # Calculate initial next_run based on frequency
+
+        # Daily and weekly runs land on fixed 86400s/604800s boundaries, so
+        # plain integer arithmetic on epoch seconds finds them without any
+        # datetime allocation; only the irregular cases need rrule/croniter
         if frequency == 'daily':
-            next_run = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-            delta = timedelta(days=1)
+            day = 86400
+            now_ts = int(time.time())
+            first_ts = (now_ts // day + 1) * day
+            occurrences = [datetime.utcfromtimestamp(first_ts + i * day)
+                           for i in range(3)]
         elif frequency == 'weekly':
-            days_until_monday = (7 - now.weekday()) % 7 or 7
-            next_run = (now + timedelta(days=days_until_monday)).replace(hour=9, minute=0, second=0, microsecond=0)
-            delta = timedelta(weeks=1)
+            week = 7 * 86400
+            epoch_monday = 4 * 86400  # 1970-01-05, the first Monday after the epoch
+            now_ts = int(time.time())
+            next_ts = ((now_ts - epoch_monday) // week) * week + epoch_monday + 9 * 3600
+            if next_ts <= now_ts:
+                next_ts += week
+            occurrences = [datetime.utcfromtimestamp(next_ts + i * week)
+                           for i in range(3)]
         elif frequency == 'monthly':
-            next_run = (now.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            delta = None  # Special handling for monthly
+            occurrences = rrule(MONTHLY, bymonthday=1, byhour=0, byminute=0,
+                                bysecond=0, dtstart=now, count=3)
+        elif frequency == 'custom' and policy.get('custom_cron') and croniter is not None:
+            cron = croniter(policy['custom_cron'], now)
+            occurrences = [cron.get_next(datetime) for _ in range(3)]
         else:
             return []
-        
-        # Generate 3 runs
-        for i in range(3):
+
+        runs = []
+        for next_run in occurrences:
             days_diff = (next_run - now).days
             runs.append({
                 'date': next_run.strftime('%Y-%m-%d %H:%M'),
                 'note': f'in {days_diff} days' if days_diff > 0 else 'today'
             })
-            next_run = (next_run + timedelta(days=32)).replace(day=1) if frequency == 'monthly' else next_run + delta
-        
         return runs
 
     def update_execution_status(self, execution_id: int, status: str, 
                                records: int = 0, error: str = None):
         """Update execution history status"""
+        # Prepared cursor: the statement is parsed once per pooled
+        # connection, so repeated status updates reuse the server-side plan
         with self.get_connection() as conn:
-            with conn.cursor() as cursor:
+            with conn.cursor(prepared=True) as cursor:
                 cursor.execute("""
-                    UPDATE sync_execution_history 
+                    UPDATE sync_execution_history
                     SET completed_at = NOW(), status = %s, 
                         records_collected = %s, error_message = %s
                     WHERE id = %s
                 """, (status, records, error, execution_id))
             conn.commit()
+        # Make the finished run visible to the history views immediately
+        _cached_history.clear()
+
+
+# Cached read paths: Streamlit reruns the whole script on every widget
+# interaction, so these TTL'd wrappers keep the sidebar and tabs from
+# re-querying MySQL until the data can actually have changed. The manager
+# argument is underscore-prefixed so st.cache_data keys only on the
+# database fingerprint (and limit/tables), not the unhashable object.
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_policy(db_key: str, _manager: SyncPolicyManager) -> Optional[Dict]:
+    return _manager._query_current_policy()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_history(db_key: str, _manager: SyncPolicyManager, limit: int) -> pd.DataFrame:
+    return _manager._query_execution_history(limit)
+
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_counts(db_key: str, _manager: SyncPolicyManager, tables: tuple) -> Dict[str, int]:
+    return _manager._query_table_counts(list(tables))
 
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _check_openproject(base_url: str, api_key: str) -> Optional[int]:
+    """Health-check OpenProject; returns the status code or None if unreachable"""
+    auth_b64 = base64.b64encode(f"apikey:{api_key}".encode()).decode()
+    try:
+        response = _OP_SESSION.get(
+            f"{base_url}/api/v3/users/me",
+            headers={'Authorization': f'Basic {auth_b64}'},
+            timeout=5
+        )
+        return response.status_code
+    except Exception:
+        return None
+
+
+@st.cache_resource
 def load_config() -> Dict:
-    """Load configuration from YAML file"""
+    """Load configuration from YAML file (parsed once per session)"""
     with open("config.yaml", 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
+
+
+@st.cache_resource
+def get_policy_manager(db_key: str, _config: Dict) -> SyncPolicyManager:
+    """One SyncPolicyManager (and its connection pool) shared across reruns"""
+    return SyncPolicyManager(_config)
+
+
+# Metric-extraction patterns, compiled once: these run against the whole
+# (potentially large) pipeline output after every manual run
+_TOTAL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Total domain records:\s*(\d+)',
+    r'Total records:\s*(\d+)',
+    r'Total records (?:extracted|collected):\s*(\d+)',
+))
+# One alternation so the component fallback is a single linear scan of the
+# output instead of one search per component; longer names come first so
+# 'Board Issues' is not swallowed by 'Issues'
+_COMPONENT_RE = re.compile(
+    r'\b(?P<name>Board Issues|Sprint Issues|Issues|Boards|Worklogs|Accounts):\s*(?P<count>\d+)',
+    re.IGNORECASE
+)
+_DURATION_PATTERN = re.compile(r'Total Duration:\s*([0-9:\.]+)')
 
 
 def extract_metrics_from_output(output: str) -> tuple:
     """Extract metrics from pipeline output"""
     records_collected = 0
     duration = None
-    
+
     # Try multiple patterns to find total records
-    patterns = [
-        r'Total domain records:\s*(\d+)',
-        r'Total records:\s*(\d+)',
-        r'Total records (extracted|collected):\s*(\d+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, output, re.IGNORECASE)
+    for pattern in _TOTAL_PATTERNS:
+        match = pattern.search(output)
         if match:
-            records_collected = int(match.groups()[-1])
+            records_collected = int(match.group(1))
             break
-    
-    # If still 0, sum individual components
+
+    # If still 0, sum individual components in one pass, keeping only the
+    # first occurrence of each (matching the old per-component search)
     if records_collected == 0:
-        for component in ['Issues', 'Boards', 'Worklogs', 'Accounts', 'Board Issues', 'Sprint Issues']:
-            comp_match = re.search(f'{component}:\\s*(\\d+)', output, re.IGNORECASE)
-            if comp_match:
-                records_collected += int(comp_match.group(1))
-    
+        component_counts = {}
+        for match in _COMPONENT_RE.finditer(output):
+            component_counts.setdefault(match.group('name').lower(),
+                                        int(match.group('count')))
+        records_collected = sum(component_counts.values())
+
     # Extract duration
-    duration_match = re.search(r'Total Duration:\s*([0-9:\.]+)', output)
+    duration_match = _DURATION_PATTERN.search(output)
     if duration_match:
         duration = duration_match.group(1)
-    
+
     return records_collected, duration
 
 
+async def _stream_pipeline(status_placeholder, timeout: int = 600):
+    """Run the pipeline subprocess, streaming its merged output live"""
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "run_pipeline.py", "--verbose", "--emit-metrics-json",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT
+    )
+
+    lines = []
+    last_update = 0.0
+
+    async def _consume():
+        nonlocal last_update
+        async for raw_line in proc.stdout:
+            line = raw_line.decode(errors='replace').rstrip()
+            lines.append(line)
+            # Throttle placeholder updates so the UI isn't redrawn per line
+            now = time.monotonic()
+            if line and now - last_update > 0.5:
+                status_placeholder.text(line)
+                last_update = now
+        await proc.wait()
+
+    try:
+        await asyncio.wait_for(_consume(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    return proc.returncode, "\n".join(lines)
+
+
 def run_pipeline_manually(policy_manager: SyncPolicyManager):
     """Trigger manual pipeline execution"""
     conn = policy_manager.get_connection()
@@ -206,25 +415,41 @@ def run_pipeline_manually(policy_manager: SyncPolicyManager):
     execution_id = cursor.lastrowid
     cursor.close()
     conn.close()
-    
+
+    status_placeholder = st.empty()
     with st.spinner("🔄 Running data collection pipeline..."):
         try:
-            result = subprocess.run(
-                [sys.executable, "run_pipeline.py", "--verbose"],
-                capture_output=True,
-                text=True,
-                timeout=600
-            )
-            
-            output = (result.stdout or "") + "\n" + (result.stderr or "")
-            records_collected, duration = extract_metrics_from_output(output)
-            
-            if result.returncode == 0:
+            # Stream the subprocess output instead of blocking on
+            # capture_output for up to ten minutes
+            returncode, output = asyncio.run(_stream_pipeline(status_placeholder))
+            status_placeholder.empty()
+
+            # Prefer the single metrics JSON line the pipeline emits;
+            # regex the whole output only when it is missing
+            metrics = None
+            for line in reversed(output.splitlines()):
+                if line.startswith('{"records"'):
+                    try:
+                        metrics = json.loads(line)
+                    except ValueError:
+                        pass
+                    break
+
+            if metrics is not None:
+                records_collected = int(metrics.get('records', 0))
+                duration = metrics.get('duration')
+            else:
+                records_collected, duration = extract_metrics_from_output(output)
+
+            if returncode == 0:
+                # The pipeline just rewrote the tables; drop the cached
+                # counts so the fallback below and the sidebar see fresh ones
+                _cached_counts.clear()
+
                 # Fallback to DB counts if parsing failed
                 if records_collected == 0:
                     try:
-                        counts = policy_manager.get_table_counts(['issues', 'boards', 'board_issues', 
-                                                                 'issue_worklogs', 'accounts'])
+                        counts = policy_manager.get_table_counts(list(_COUNTED_TABLES))
                         records_collected = counts.get('total', 0)
                     except Exception:
                         pass
@@ -238,12 +463,13 @@ def run_pipeline_manually(policy_manager: SyncPolicyManager):
                     st.info(f"⏱️ **Execution time:** {duration}")
                 st.info("💡 Check the 'Execution History' tab to see this run logged!")
             else:
-                error_msg = result.stderr[:1000] if result.stderr else "Unknown error"
+                error_msg = output[-1000:] if output else "Unknown error"
                 policy_manager.update_execution_status(execution_id, 'failed', records_collected, error_msg)
                 st.error("❌ Pipeline failed")
-                st.text_area("Error Output", result.stderr, height=200)
-                
-        except subprocess.TimeoutExpired:
+                st.text_area("Error Output", output[-4000:], height=200)
+
+        except asyncio.TimeoutError:
+            status_placeholder.empty()
             policy_manager.update_execution_status(execution_id, 'failed', 0, 'Execution timeout (>10 minutes)')
             st.error("⏱️ Pipeline execution timed out (> 10 minutes)")
         except Exception as e:
@@ -265,8 +491,7 @@ def render_sidebar(policy_manager: SyncPolicyManager, config: Dict):
                 
                 if records == 0:
                     try:
-                        counts = policy_manager.get_table_counts(['issues', 'boards', 'board_issues', 
-                                                                 'issue_worklogs', 'accounts'])
+                        counts = policy_manager.get_table_counts(list(_COUNTED_TABLES))
                         records = counts.get('total', 0)
                     except Exception:
                         pass
@@ -301,19 +526,13 @@ def render_sidebar(policy_manager: SyncPolicyManager, config: Dict):
         if 'your-openproject-instance' in base_url or 'your-api-key' in api_key:
             st.warning("⚠️ OpenProject Not Configured")
         else:
-            try:
-                import requests
-                import base64
-                auth_b64 = base64.b64encode(f"apikey:{api_key}".encode()).decode()
-                response = requests.get(f"{base_url}/api/v3/users/me", 
-                                      headers={'Authorization': f'Basic {auth_b64}'}, 
-                                      timeout=5)
-                if response.status_code == 200:
-                    st.success("✅ OpenProject Connected")
-                else:
-                    st.error(f"❌ Auth Failed ({response.status_code})")
-            except Exception:
+            status_code = _check_openproject(base_url, api_key)
+            if status_code == 200:
+                st.success("✅ OpenProject Connected")
+            elif status_code is None:
                 st.error("❌ OpenProject Unreachable")
+            else:
+                st.error(f"❌ Auth Failed ({status_code})")
         
         st.markdown("---")
         st.header("🚀 Quick Actions")
@@ -435,18 +654,23 @@ def render_execution_history_tab(policy_manager: SyncPolicyManager):
         else:
             history['started_at'] = pd.to_datetime(history['started_at'])
             history['completed_at'] = pd.to_datetime(history['completed_at'])
-            
+
+            # One pass over the status column instead of a boolean mask and
+            # filtered copy per metric
+            status_counts = history['status'].value_counts()
+            avg_duration = history['duration_seconds'].mean()
+
             # Display metrics
             col1, col2, col3, col4 = st.columns(4)
-            
+
             with col1:
                 st.metric("Total Runs", len(history))
             with col2:
-                st.metric("Successful", len(history[history['status'] == 'success']))
+                st.metric("Successful", int(status_counts.get('success', 0)))
             with col3:
-                st.metric("Failed", len(history[history['status'] == 'failed']))
+                st.metric("Failed", int(status_counts.get('failed', 0)))
             with col4:
-                st.metric("Avg Duration", f"{history['duration_seconds'].mean():.0f}s")
+                st.metric("Avg Duration", f"{avg_duration:.0f}s")
             
             # Display table
             st.dataframe(
@@ -493,7 +717,9 @@ def main():
     
     try:
         config = load_config()
-        policy_manager = SyncPolicyManager(config)
+        db = config['database']
+        policy_manager = get_policy_manager(
+            f"{db['host']}:{db['port']}/{db['database']}", config)
     except Exception as e:
         st.error(f"❌ Failed to load configuration: {e}")
         st.stop()